@@ -15,14 +15,56 @@
 
 import abc as _abc
 import dataclasses as _dataclasses
+import operator as _operator
 import os as _os
-import re as _re
+import string as _string
 import typing as _typing
+import typing_extensions as _typing_extensions
 
 _T = _typing.TypeVar("_T", str, int, float, bool, list)
 
+_NAME_CHARS = frozenset(_string.ascii_uppercase + _string.digits + "_")
 
-@_dataclasses.dataclass(frozen=True)
+_BOOL_TRUE_VALUES = frozenset(("true", "t", "1", "y", "yes"))
+_BOOL_FALSE_VALUES = frozenset(("false", "f", "0", "n", "no"))
+
+_COMPARATORS: dict[str, _typing.Callable[[_typing.Any, _typing.Any], bool]] = {
+    "==": _operator.eq,
+    ">": _operator.gt,
+    ">=": _operator.ge,
+    "<": _operator.lt,
+    "<=": _operator.le,
+}
+
+
+@_typing_extensions.dataclass_transform(frozen_default=True,
+                                        field_specifiers=(_dataclasses.field,))
+def _opt_frozen_dataclass(**kwargs):
+    """
+    A dataclass decorator that is frozen when running with assertions
+    enabled and a plain dataclass under `python -O`, which avoids the
+    frozen `__setattr__` overhead when constructing instances.
+    Classes in the same inheritance chain must all use this decorator.
+
+    Instances must be treated as immutable even when they aren't frozen.
+    Expressions validate and cache their CEL rendering at construction, so
+    mutating one under `python -O` leaves those caches stale.
+    """
+
+    def wrap(cls):
+        # A non-frozen dataclass with eq=True gets __hash__ = None, so ask for
+        # the same field-based hash a frozen one would get. Classes that
+        # define their own __hash__, or use eq=False to inherit one, keep it.
+        unsafe_hash = (not __debug__ and kwargs.get("eq", True) and
+                       "__hash__" not in cls.__dict__)
+        return _dataclasses.dataclass(frozen=__debug__,
+                                      unsafe_hash=unsafe_hash,
+                                      **kwargs)(cls)
+
+    return wrap
+
+
+@_opt_frozen_dataclass(slots=True)
 class Expression(_abc.ABC, _typing.Generic[_T]):
     """
     A CEL expression which can be evaluated during function deployment, and
@@ -30,6 +72,12 @@ class Expression(_abc.ABC, _typing.Generic[_T]):
     an Expression<number> as the value of an option that normally accepts numbers.
     """
 
+    # pylint: disable-next=invalid-field-call
+    _cel: _typing.Optional[str] = _dataclasses.field(default=None,
+                                                     init=False,
+                                                     repr=False,
+                                                     compare=False)
+
     def value(self) -> _T:
         """
         Returns the Expression's runtime value, based on the CLI's resolution of params.
@@ -40,30 +88,55 @@ class Expression(_abc.ABC, _typing.Generic[_T]):
         """
         Returns the Expression's representation as a braced CEL expression.
         """
-        return f"{{{{ {self} }}}}"
+        # Expressions must not be mutated (see _opt_frozen_dataclass), so the
+        # rendered string is cached.
+        cel = self._cel
+        if cel is None:
+            cel = f"{{{{ {self} }}}}"
+            object.__setattr__(self, "_cel", cel)
+        return cel
 
 
-def _quote_if_string(literal: _T) -> _T:
-    return literal if not isinstance(literal, str) else f'"{literal}"'
+_params: dict[str, Expression] = {}
+_params_order: list[Expression] = []
 
 
-_params: dict[str, Expression] = {}
+def _all_params() -> list[Expression]:
+    """
+    Returns every declared param, excluding default params, in declaration order.
+    """
+    return list(_params_order)
 
 
-@_dataclasses.dataclass(frozen=True)
+@_opt_frozen_dataclass(slots=True)
 class TernaryExpression(Expression[_T], _typing.Generic[_T]):
+    """
+    A CEL expression that evaluates to one of two literals based on the
+    value of a boolean expression.
+    """
     test: Expression[bool]
     if_true: _T
     if_false: _T
+    # pylint: disable-next=invalid-field-call
+    _str: str = _dataclasses.field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        # String literals are quoted in CEL.
+        if_true = (f'"{self.if_true}"'
+                   if isinstance(self.if_true, str) else self.if_true)
+        if_false = (f'"{self.if_false}"'
+                    if isinstance(self.if_false, str) else self.if_false)
+        object.__setattr__(self, "_str",
+                           f"{self.test} ? {if_true} : {if_false}")
 
     def value(self) -> _T:
         return self.if_true if self.test.value() else self.if_false
 
-    def __str__(self) -> str:
-        return f"{self.test} ? {_quote_if_string(self.if_true)} : {_quote_if_string(self.if_false)}"
+    def __str__(self) -> str:  # pylint: disable=invalid-str-returned
+        return self._str
 
 
-@_dataclasses.dataclass(frozen=True)
+@_opt_frozen_dataclass(slots=True)
 class CompareExpression(Expression[bool], _typing.Generic[_T]):
     """
     A CEL expression that evaluates to boolean true or false based on a comparison
@@ -72,30 +145,32 @@ class CompareExpression(Expression[bool], _typing.Generic[_T]):
     comparator: str
     left: Expression[_T]
     right: _T
+    # pylint: disable-next=invalid-field-call
+    _str: str = _dataclasses.field(init=False, repr=False, compare=False)
+    # pylint: disable-next=invalid-field-call
+    _op: _typing.Callable[[_typing.Any, _typing.Any], bool] = _dataclasses.field(
+        init=False, repr=False, compare=False)
 
-    def value(self) -> bool:
-        left: _T = self.left.value()
-        if self.comparator == "==":
-            return left == self.right
-        elif self.comparator == ">":
-            return left > self.right
-        elif self.comparator == ">=":
-            return left >= self.right
-        elif self.comparator == "<":
-            return left < self.right
-        elif self.comparator == "<=":
-            return left <= self.right
-        else:
+    def __post_init__(self):
+        op = _COMPARATORS.get(self.comparator)
+        if op is None:
             raise ValueError(f"Unknown comparator {self.comparator}")
+        object.__setattr__(self, "_op", op)
+        right = f'"{self.right}"' if isinstance(self.right, str) else self.right
+        object.__setattr__(self, "_str",
+                           f"{self.left} {self.comparator} {right}")
 
-    def __str__(self) -> str:
-        return f"{self.left} {self.comparator} {_quote_if_string(self.right)}"
+    def value(self) -> bool:
+        return self._op(self.left.value(), self.right)  # pylint: disable=not-callable
+
+    def __str__(self) -> str:  # pylint: disable=invalid-str-returned
+        return self._str
 
     def then(self, if_true: _T, if_false: _T) -> TernaryExpression[_T]:
         return TernaryExpression(self, if_true, if_false)
 
 
-@_dataclasses.dataclass(frozen=True)
+@_dataclasses.dataclass(frozen=True, slots=True)
 class SelectOptions(_typing.Generic[_T]):
     """
     A representation of an option that can be selected via a SelectInput.
@@ -108,7 +183,7 @@ class SelectOptions(_typing.Generic[_T]):
     """The displayed label for the option."""
 
 
-@_dataclasses.dataclass(frozen=True)
+@_dataclasses.dataclass(frozen=True, slots=True)
 class SelectInput(_typing.Generic[_T]):
     """
     Specifies that a Param's value should be determined by having the user select
@@ -119,7 +194,7 @@ class SelectInput(_typing.Generic[_T]):
     """A list of user selectable options."""
 
 
-@_dataclasses.dataclass(frozen=True)
+@_dataclasses.dataclass(frozen=True, slots=True)
 class TextInput:
     """
     Specifies that a Param's value should be determined by prompting the user
@@ -144,7 +219,12 @@ class TextInput:
     """
 
 
-@_dataclasses.dataclass(frozen=True)
+# Shared by every Param that doesn't specify an input. TextInput is frozen, so
+# a single instance is safe to share.
+_DEFAULT_TEXT_INPUT = TextInput()
+
+
+@_dataclasses.dataclass(frozen=True, slots=True)
 class ResourceInput:
     """
     Specifies that a Param's value should be determined by having the user
@@ -158,7 +238,7 @@ class ResourceInput:
     """
 
 
-@_dataclasses.dataclass(frozen=True)
+@_opt_frozen_dataclass(slots=True)
 class Param(Expression[_T]):
     """
     A param is a declared dependency on an external value.
@@ -191,7 +271,7 @@ class Param(Expression[_T]):
     """
 
     input: _typing.Union[TextInput, ResourceInput,
-                         SelectInput[_T]] = TextInput()
+                         SelectInput[_T]] = _DEFAULT_TEXT_INPUT
     """
     The type of input that is required for this param, e.g. TextInput.
     """
@@ -208,21 +288,26 @@ class Param(Expression[_T]):
     def __str__(self) -> str:
         return f"params.{self.name}"
 
+    def __hash__(self) -> int:
+        # Names are unique, so they are enough to hash a param. Defining this
+        # explicitly also keeps params hashable when not frozen under -O.
+        # Subclasses don't add fields and use eq=False to inherit this and
+        # Param's __eq__.
+        return hash(self.name)
+
     def __post_init__(self):
-        if isinstance(self, _DefaultStringParam):
-            return
-        if not _re.match(r"^[A-Z0-9_]+$", self.name):
+        if not self.name or not _NAME_CHARS.issuperset(self.name):
             raise ValueError(
                 "Parameter names must only use uppercase letters, numbers and "
                 "underscores, e.g. 'UPPER_SNAKE_CASE'.")
-        if self.name in _params:
+        if _params.setdefault(self.name, self) is not self:
             raise ValueError(
                 f"Duplicate Parameter Error: The parameter '{self.name}' has already been declared."
             )
-        _params[self.name] = self
+        _params_order.append(self)
 
 
-@_dataclasses.dataclass(frozen=True)
+@_opt_frozen_dataclass(slots=True)
 class SecretParam(Expression[str]):
     """
     A secret param is a declared dependency on an external secret.
@@ -252,16 +337,19 @@ class SecretParam(Expression[str]):
     def __str__(self):
         return f"params.{self.name}"
 
+    def __hash__(self) -> int:
+        return hash(self.name)
+
     def __post_init__(self):
-        if not _re.match(r"^[A-Z0-9_]+$", self.name):
+        if not self.name or not _NAME_CHARS.issuperset(self.name):
             raise ValueError(
                 "Parameter names must only use uppercase letters, numbers and "
                 "underscores, e.g. 'UPPER_SNAKE_CASE'.")
-        if self.name in _params:
+        if _params.setdefault(self.name, self) is not self:
             raise ValueError(
                 f"Duplicate Parameter Error: The parameter '{self.name}' has already been declared."
             )
-        _params[self.name] = self
+        _params_order.append(self)
 
     def value(self) -> str:
         """Current value of this parameter."""
@@ -274,13 +362,14 @@ class SecretParam(Expression[str]):
         return self.compare("==", right)
 
 
-@_dataclasses.dataclass(frozen=True)
+@_opt_frozen_dataclass(slots=True, eq=False)
 class StringParam(Param[str]):
     """A parameter as a string value."""
 
     def value(self) -> str:
-        if _os.environ.get(self.name) is not None:
-            return _os.environ[self.name]
+        env_value = _os.environ.get(self.name)
+        if env_value is not None:
+            return env_value
 
         if self.default is not None:
             return self.default
@@ -288,40 +377,43 @@ class StringParam(Param[str]):
         return str()
 
 
-@_dataclasses.dataclass(frozen=True)
+@_opt_frozen_dataclass(slots=True, eq=False)
 class IntParam(Param[int]):
     """A parameter as a int value."""
 
     def value(self) -> int:
-        if _os.environ.get(self.name) is not None:
-            return int(_os.environ[self.name])
+        env_value = _os.environ.get(self.name)
+        if env_value is not None:
+            return int(env_value)
         if self.default is not None:
             return self.default
         return int()
 
 
-@_dataclasses.dataclass(frozen=True)
+@_opt_frozen_dataclass(slots=True, eq=False)
 class FloatParam(Param[float]):
     """A parameter as a float value."""
 
     def value(self) -> float:
-        if _os.environ.get(self.name) is not None:
-            return float(_os.environ[self.name])
+        env_value = _os.environ.get(self.name)
+        if env_value is not None:
+            return float(env_value)
         if self.default is not None:
             return self.default
         return float()
 
 
-@_dataclasses.dataclass(frozen=True)
+@_opt_frozen_dataclass(slots=True, eq=False)
 class BoolParam(Param[bool]):
     """A parameter as a bool value."""
 
     def value(self) -> bool:
         env_value = _os.environ.get(self.name)
         if env_value is not None:
-            if env_value.lower() in ["true", "t", "1", "y", "yes"]:
+            lowered = env_value.lower()
+            if lowered in _BOOL_TRUE_VALUES:
                 return True
-            if env_value.lower() in ["false", "f", "0", "n", "no"]:
+            if lowered in _BOOL_FALSE_VALUES:
                 return False
             raise ValueError(f"Invalid value for {self.name}: {env_value}")
         if self.default is not None:
@@ -329,19 +421,20 @@ class BoolParam(Param[bool]):
         return False
 
 
-@_dataclasses.dataclass(frozen=True)
+@_opt_frozen_dataclass(slots=True, eq=False)
 class ListParam(Param[list]):
     """A parameter as a list of strings."""
 
     def value(self) -> list[str]:
-        if _os.environ.get(self.name) is not None:
-            return list(filter(len, _os.environ[self.name].split(",")))
+        env_value = _os.environ.get(self.name)
+        if env_value is not None:
+            return [item for item in env_value.split(",") if item]
         if self.default is not None:
             return self.default
         return []
 
 
-@_dataclasses.dataclass(frozen=True)
+@_opt_frozen_dataclass(slots=True, eq=False)
 class _DefaultStringParam(StringParam):
     """
     Internal use only.
@@ -349,6 +442,10 @@ class _DefaultStringParam(StringParam):
     These are excluded from the list of parameters that are prompted to the user.
     """
 
+    def __post_init__(self):
+        # Default params are neither validated nor registered.
+        pass
+
 
 PROJECT_ID = _DefaultStringParam(
     "GCLOUD_PROJECT",
@@ -18,6 +18,7 @@
 # pylint: disable=invalid-name
 
 import dataclasses as _dataclasses
+import functools as _functools
 import typing as _typing
 import typing_extensions as _typing_extensions
 
@@ -90,7 +91,7 @@ class VpcSettings(_typing.TypedDict):
     egressSettings: _typing_extensions.NotRequired[str | _util.Sentinel]
 
 
-@_dataclasses.dataclass(frozen=True)
+@_dataclasses.dataclass(frozen=True, slots=True)
 class ManifestEndpoint:
     """A definition of a function as appears in the Manifest."""
 
@@ -124,7 +125,7 @@ class ManifestRequiredApi(_typing.TypedDict):
     reason: _typing_extensions.Required[str]
 
 
-@_dataclasses.dataclass(frozen=True)
+@_dataclasses.dataclass(frozen=True, slots=True)
 class ManifestStack:
     endpoints: dict[str, ManifestEndpoint]
     specVersion: str = "v1alpha1"
@@ -134,78 +135,131 @@ class ManifestStack:
         default_factory=list[ManifestRequiredApi])
 
 
+# Maps param classes to their spec type. Subclasses that aren't listed are
+# resolved against these entries, in order, the first time they are seen.
+_param_types: dict[type, str] = {
+    _params.BoolParam: "boolean",
+    _params.IntParam: "int",
+    _params.FloatParam: "float",
+    _params.SecretParam: "secret",
+    _params.ListParam: "list",
+    _params.StringParam: "string",
+    _params._DefaultStringParam: "string",  # pylint: disable=protected-access
+}
+
+
+def _param_type(cls: type) -> str:
+    param_type = _param_types.get(cls)
+    if param_type is None:
+        param_type = next(
+            (spec_type for param_cls, spec_type in _param_types.items()
+             if issubclass(cls, param_cls)), None)
+        if param_type is None:
+            raise NotImplementedError("Unsupported param type.")
+        _param_types[cls] = param_type
+    return param_type
+
+
 def _param_to_spec(
         param: _params.Param | _params.SecretParam) -> dict[str, _typing.Any]:
+    # Param attributes other than the default are always plain values, so the
+    # spec is built directly rather than through _dict_to_spec.
     spec_dict: dict[str, _typing.Any] = {
         "name": param.name,
-        "label": param.label,
-        "description": param.description,
-        "immutable": param.immutable,
+        "type": _param_type(type(param)),
     }
+    if param.label is not None:
+        spec_dict["label"] = param.label
+    if param.description is not None:
+        spec_dict["description"] = param.description
+    if param.immutable is not None:
+        spec_dict["immutable"] = param.immutable
+
+    if isinstance(param, _params.Param) and param.default is not None:
+        if isinstance(param, _params.ListParam):
+            spec_dict["default"] = ",".join(param.default)
+        else:
+            spec_dict["default"] = _object_to_spec(param.default)
+    # TODO spec representation of inputs
+
+    return spec_dict
+
+
+def _enum_to_spec(data: _Enum) -> object:
+    return data.value
+
+
+def _expression_to_spec(data: _params.Expression) -> str:
+    return data.to_cel()
+
 
-    if isinstance(param, _params.Param):
-        spec_dict["default"] = param.default
-        # TODO spec representation of inputs
-
-    if isinstance(param, _params.BoolParam):
-        spec_dict["type"] = "boolean"
-    elif isinstance(param, _params.IntParam):
-        spec_dict["type"] = "int"
-    elif isinstance(param, _params.FloatParam):
-        spec_dict["type"] = "float"
-    elif isinstance(param, _params.SecretParam):
-        spec_dict["type"] = "secret"
-    elif isinstance(param, _params.ListParam):
-        spec_dict["type"] = "list"
-        if spec_dict["default"] is not None:
-            spec_dict["default"] = ",".join(spec_dict["default"])
-    elif isinstance(param, _params.StringParam):
-        spec_dict["type"] = "string"
+def _list_to_spec(data: list) -> list:
+    # Lists of plain strings (e.g. regions) need no conversion. The exact type
+    # check keeps str-based Enums on the conversion path.
+    # pylint: disable=unidiomatic-typecheck
+    if all(type(item) is str for item in data):
+        return list(data)
+    return [_object_to_spec(item) for item in data]
+
+
+def _value_to_spec(data: object) -> object:
+    return data
+
+
+def _resolve_spec_handler(
+        cls: type) -> _typing.Callable[[_typing.Any], object]:
+    if issubclass(cls, _Enum):
+        return _enum_to_spec
+    elif issubclass(cls, _params.Expression):
+        return _expression_to_spec
+    elif _dataclasses.is_dataclass(cls):
+        return _dataclass_to_spec
+    elif issubclass(cls, list):
+        return _list_to_spec
+    elif issubclass(cls, dict):
+        return _dict_to_spec
     else:
-        raise NotImplementedError("Unsupported param type.")
+        return _value_to_spec
+
 
-    return _dict_to_spec(spec_dict)
+# Handlers are resolved once per concrete type, so that subclasses (e.g. of
+# Expression) only pay for the issubclass chain the first time they are seen.
+_spec_handlers: dict[type, _typing.Callable[[_typing.Any], object]] = {}
 
 
 def _object_to_spec(data) -> object:
-    if isinstance(data, _Enum):
-        return data.value
-    elif isinstance(data, _params.Expression):
-        return data.to_cel()
-    elif _dataclasses.is_dataclass(data):
-        return _dataclass_to_spec(data)
-    elif isinstance(data, list):
-        return list(map(_object_to_spec, data))
-    elif isinstance(data, dict):
-        return _dict_to_spec(data)
-    else:
-        return data
+    cls = type(data)
+    handler = _spec_handlers.get(cls)
+    if handler is None:
+        handler = _spec_handlers[cls] = _resolve_spec_handler(cls)
+    return handler(data)
 
 
-def _dict_factory(data: list[_typing.Tuple[str, _typing.Any]]) -> dict:
-    out: dict = {}
-    for key, value in data:
-        if value is not None:
-            out[key] = _object_to_spec(value)
-    return out
+@_functools.lru_cache(maxsize=None)
+def _field_names(cls: type) -> tuple[str, ...]:
+    return tuple(field.name for field in _dataclasses.fields(cls))
 
 
 def _dataclass_to_spec(data) -> dict:
-    out: dict = {}
-    for field in _dataclasses.fields(data):
-        value = _object_to_spec(getattr(data, field.name))
-        if value is not None:
-            out[field.name] = value
-    return out
+    cls: type = type(data)
+    return {
+        name: _object_to_spec(value)
+        for name in _field_names(cls)
+        if (value := getattr(data, name)) is not None
+    }
 
 
 def _dict_to_spec(data: dict) -> dict:
-    return _dict_factory(list(data.items()))
+    return {
+        key: _object_to_spec(value)
+        for key, value in data.items()
+        if value is not None
+    }
 
 
 def manifest_to_spec_dict(manifest: ManifestStack) -> dict:
     params = manifest.params
     out: dict = _dataclass_to_spec(manifest)
-    if params is not None:
+    if params:
         out["params"] = list(map(_param_to_spec, params))
     return out
@@ -71,8 +71,7 @@ def functions_as_yaml(functions: dict) -> str:
         endpoint = function.__firebase_endpoint__
         endpoints[name] = endpoint
     manifest_stack = _manifest.ManifestStack(endpoints=endpoints,
-                                             params=list(
-                                                 _params._params.values()))
+                                             params=_params._all_params())
     manifest_spec = _manifest.manifest_to_spec_dict(manifest_stack)
     manifest_spec_with_sentinels = to_spec(manifest_spec)
 
@@ -13,7 +13,10 @@
 # limitations under the License.
 """Manifest unit tests."""
 
+import pytest
+
 import firebase_functions.private.manifest as _manifest
+import firebase_functions.options as _options
 import firebase_functions.params as _params
 
 full_endpoint = _manifest.ManifestEndpoint(
@@ -119,6 +122,27 @@ class TestManifestStack:
         assert (stack_dict == full_stack_dict
                ), "Generated manifest spec dict does not match expected dict."
 
+    def test_param_subclass_type(self):
+        """Check unlisted Param subclasses use their base class's spec type."""
+
+        class MyParam(_params.StringParam):
+            pass
+
+        # pylint: disable=protected-access
+        param_spec = _manifest._param_to_spec(MyParam("MY_PARAM_TEST"))
+        assert param_spec == {"name": "MY_PARAM_TEST", "type": "string"}, \
+            "Generated param spec dict does not match expected dict."
+        assert _manifest._param_types[MyParam] == "string", \
+            "Resolved param spec type was not cached."
+
+    def test_unsupported_param_type(self):
+        """Check params without a known spec type are rejected."""
+        # pylint: disable=protected-access
+        # The class is checked directly, since a declared instance would stay
+        # in the params registry and break other manifests.
+        with pytest.raises(NotImplementedError):
+            _manifest._param_type(_params.Param)
+
 
 class TestManifestEndpoint:
     """Manifest unit tests."""
@@ -160,6 +184,33 @@ class TestManifestEndpoint:
         assert (expressions_actual_dict == expressions_expected_dict
                ), "Generated endpoint spec dict does not match expected dict."
 
+    def test_endpoint_handler_resolution(self):
+        """Check values convert by their type once handlers are cached."""
+
+        class MyIntParam(_params.IntParam):
+            pass
+
+        # pylint: disable=protected-access
+        first_dict = _manifest._dataclass_to_spec(
+            _manifest.ManifestEndpoint(
+                region=[_options.SupportedRegion.US_CENTRAL1, "europe-west1"],
+                concurrency=_params.IntParam("HANDLER_TEST")))
+        # str-based Enums compare equal to their values, so check the types.
+        assert [type(region) for region in first_dict["region"]] == [str, str], \
+            "str-based Enum in a list was not converted to its value."
+        assert first_dict["region"] == ["us-central1", "europe-west1"], \
+            "Generated region list does not match expected list."
+        # The IntParam handler is cached now, and a new subclass has to be
+        # resolved on its own.
+        second_dict = _manifest._dataclass_to_spec(
+            _manifest.ManifestEndpoint(
+                region=[_options.SupportedRegion.US_EAST1],
+                concurrency=MyIntParam("HANDLER_SUBCLASS_TEST")))
+        assert [type(region) for region in second_dict["region"]] == [str], \
+            "str-based Enum in a list was not converted to its value."
+        assert second_dict["concurrency"] == "{{ params.HANDLER_SUBCLASS_TEST }}", \
+            "Expression subclass was not converted to a CEL string."
+
     def test_endpoint_nones(self):
         """Check all None values are removed."""
         expressions_test = _manifest.ManifestEndpoint(
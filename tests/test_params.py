@@ -12,6 +12,9 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 """Param unit tests."""
+import os
+import subprocess
+import sys
 from os import environ
 
 import pytest
@@ -119,6 +122,11 @@ class TestIntParams:
         assert (params.IntParam("INT_TEST2", default=456).equals(123).value() is
                 False), "Failure, equality check returned False"
 
+    def test_int_param_unknown_comparator(self):
+        """Test unknown comparators are rejected when the expression is built."""
+        with pytest.raises(ValueError):
+            params.IntParam("INT_TEST3").compare("!=", 123)
+
 
 class TestStringParams:
     """StringParam unit tests."""
@@ -135,6 +143,12 @@ class TestStringParams:
             params.StringParam("lower")
         assert "UPPER_SNAKE_CASE" in str(context)
 
+    def test_param_name_empty(self):
+        """Testing if empty param names are rejected."""
+        with pytest.raises(ValueError) as context:
+            params.StringParam("")
+        assert "UPPER_SNAKE_CASE" in str(context)
+
     def test_string_param_empty_default(self):
         """Testing if string param defaults to empty string if no value and no default."""
         assert params.StringParam("STRING_DEFAULT_TEST1").value() == str(), \
@@ -191,6 +205,29 @@ class TestListParams:
             ["123"]).value() is False), "Failure, equality check returned False"
 
 
+class TestExpressions:
+    """Expression unit tests."""
+
+    def test_expressions_hashable(self):
+        """Test params and expressions are hashable, including under -O."""
+        code = ("from firebase_functions import params\n"
+                "param = params.IntParam('HASH_TEST')\n"
+                "compare = param.compare('>', 2)\n"
+                "hash(param)\n"
+                "hash(params.SecretParam('HASH_SECRET_TEST'))\n"
+                "hash(compare)\n"
+                "hash(compare.then('a', 'b'))\n")
+        env = dict(environ, PYTHONPATH=os.pathsep.join(sys.path))
+        # Dataclasses are only frozen when assertions are enabled, so check
+        # both modes in a fresh interpreter.
+        for flags in ([], ["-O"]):
+            result = subprocess.run([sys.executable, *flags, "-c", code],
+                                    env=env,
+                                    capture_output=True,
+                                    check=False)
+            assert result.returncode == 0, result.stderr.decode()
+
+
 class TestParamsManifest:
     """
     Tests any created params are tracked for the purposes
@@ -206,6 +243,8 @@ class TestParamsManifest:
         # pylint: disable=protected-access
         assert params._params["TEST_STORING"] == param, \
             "Failure, param was not stored"
+        assert params._all_params()[-1] is param, \
+            "Failure, param was not stored in declaration order"
 
     def test_default_params_not_stored(self):
         """Testing if default params are skipped from being stored."""
@@ -216,3 +255,13 @@ class TestParamsManifest:
         # pylint: disable=protected-access
         assert params._params.get("GCLOUD_PROJECT") is None, \
             "Failure, default param was stored when it should not have been"
+
+    def test_duplicate_params_rejected(self):
+        """Testing if declaring a param name twice raises and keeps the first."""
+        param = params.StringParam("TEST_DUPLICATE")
+        with pytest.raises(ValueError) as context:
+            params.IntParam("TEST_DUPLICATE")
+        assert "Duplicate Parameter Error" in str(context)
+        # pylint: disable=protected-access
+        assert params._params["TEST_DUPLICATE"] is param, \
+            "Failure, duplicate param replaced the original"